@@ -3,23 +3,77 @@
 # Details: Live scraping, AI PDF summary, Hindi translation, comprehensive search
 
 import re
+import asyncio
 import sqlite3
 import requests
 import os
 import io
+import queue
 import tempfile
 import threading
+import hashlib
+import functools
 import concurrent.futures
+import multiprocessing
+from collections import OrderedDict
 from datetime import datetime
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify
+from flask_caching import Cache
 from bs4 import BeautifulSoup
+from apscheduler.schedulers.background import BackgroundScheduler
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # PDF and translation imports
+# Fast JSON encoding for API responses (falls back to Flask's jsonify)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Detect gevent monkey-patching (gunicorn -k gevent patches before importing the app)
+try:
+    import gevent
+    from gevent import monkey
+    GEVENT_PATCHED = monkey.is_module_patched('threading')
+except ImportError:
+    GEVENT_PATCHED = False
+
+# Async HTTP/2 client for fanning out PDF downloads (falls back to the thread pool)
+try:
+    import httpx
+    import h2  # noqa: F401  (HTTP/2 support for httpx)
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# HTML parser: lxml (C) when installed, else the pure-Python stdlib parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+try:
+    import fitz  # PyMuPDF
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
 try:
     import pdfplumber
-    PDF_AVAILABLE = True
+    PDFPLUMBER_AVAILABLE = True
 except ImportError:
-    PDF_AVAILABLE = False
+    PDFPLUMBER_AVAILABLE = False
+
+PDF_AVAILABLE = PYMUPDF_AVAILABLE or PDFPLUMBER_AVAILABLE
+
+try:
+    import cld3
+    CLD3_AVAILABLE = True
+except ImportError:
+    CLD3_AVAILABLE = False
 
 try:
     from langdetect import detect
@@ -27,6 +81,13 @@ try:
 except ImportError:
     LANGDETECT_AVAILABLE = False
 
+try:
+    import torch
+    from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
+    OFFLINE_TRANSLATOR_AVAILABLE = True
+except ImportError:
+    OFFLINE_TRANSLATOR_AVAILABLE = False
+
 try:
     from googletrans import Translator
     translator = Translator()
@@ -38,6 +99,14 @@ app = Flask(__name__)
 
 # --- Configuration ---
 DB_FILE = "galgotias_cache.db"
+# Idle connections kept for reuse by request threads (the dev server starts a thread per request)
+DB_POOL_SIZE = 8
+# Response cache directory, beside the DB so every gunicorn worker shares (and clears) it
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(DB_FILE)), ".flask_cache")
+
+# Response cache for the read-heavy routes; cleared whenever the DB changes
+cache = Cache(app, config={'CACHE_TYPE': 'FileSystemCache', 'CACHE_DIR': CACHE_DIR,
+                           'CACHE_DEFAULT_TIMEOUT': 60})
 BASE_URL = "https://www.galgotiasuniversity.edu.in"
 EXAM_URL = f"{BASE_URL}/p/announcements/examination-announcement"
 HEADERS = {
@@ -48,21 +117,189 @@ HEADERS = {
 REQUEST_TIMEOUT = 15
 PDF_DOWNLOAD_TIMEOUT = 30
 
+# Offline Hindi -> English translation model (used when transformers is installed)
+TRANSLATION_MODEL = "Helsinki-NLP/opus-mt-hi-en"
+TRANSLATION_CHUNK_CHARS = 400
+TRANSLATION_BATCH_SIZE = 16
+TRANSLATION_MAX_CHARS = 22500
+
+# PDF download buffering: keep small PDFs in memory, spill larger ones to a temp file
+# (opened by name in the analysis process, never read back into RAM), reject huge ones
+PDF_SPOOL_MAX_SIZE = 4 * 1024 * 1024
+PDF_MAX_BYTES = 50 * 1024 * 1024
+
+# PDF analysis processes; each may load its own copy of the translation model
+PDF_WORKERS = min(4, os.cpu_count() or 1)
+
+# Maximum simultaneous PDF downloads when fetching with httpx
+PDF_FETCH_CONCURRENCY = 20
+
+# Shared HTTP session: keeps TCP/TLS connections alive across the scrape and PDF downloads
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+))
+
+# How often the background scheduler re-scrapes the announcements page
+SYNC_INTERVAL_MINUTES = 30
+# Held by the one gunicorn worker that runs the scheduler (see gunicorn.conf.py)
+SCHEDULER_LOCK_FILE = DB_FILE + ".scheduler.lock"
+
 # Maximum number of announcements to keep in database
 # When this limit is reached, oldest announcements will be automatically deleted
 MAX_ANNOUNCEMENTS = 470
 
-# Thread pool for async operations
+# Merge FTS5 index segments and refresh planner stats once every N syncs
+FTS_OPTIMIZE_EVERY = 10
+
+# Batches larger than this rebuild the FTS index once instead of indexing row by row
+FTS_BULK_THRESHOLD = 1000
+
+# --- Precompiled Regex Patterns ---
+# Scraper
+_VIEW_DETAIL = re.compile(r"View Detail", re.I)
+_PDF_HREF = re.compile(r"\.pdf", re.I)
+_DATE_DMY = re.compile(r"\b(\d{2}[-/]\d{2}[-/]\d{4})\b")
+_DATE_WORDS = re.compile(r"\b(\d{1,2}\s+\w+\s+\d{4})\b")
+_LEAD_PUNCT = re.compile(r"^[\.\-\:\s]+")
+# Search query parsing
+_DATE_ANY = re.compile(r'\b(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})\b')
+_YEAR = re.compile(r'\b(20\d{2})\b')
+_MONTH = re.compile(r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\b', re.I)
+# PDF key info
+_PAPER_CODE = re.compile(r'\b([A-Z]{2,4}[-\s]?\d{3,4}[-\s]?[A-Z]?)\b', re.I)
+_DATE_MONTH_NAME = re.compile(r'\b(\d{1,2}\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+\d{2,4})\b', re.I)
+_TIME = re.compile(r'\b(\d{1,2}[:\.]?\d{2}\s*(?:am|pm|AM|PM)?)\b')
+_SUBJECTS = re.compile(r'\b(mathematics|physics|chemistry|english|computer|science|programming|data\s+structure|algorithm|database|network|software|operating\s+system)\b')
+
+def init_pdf_worker():
+    """Keep each analysis process to one torch thread so the pool does not oversubscribe the CPU."""
+    if OFFLINE_TRANSLATOR_AVAILABLE:
+        torch.set_num_threads(1)
+
+
+# Thread pool for I/O-bound async operations (PDF downloads)
 executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
 
-# Cleanup executor on exit
+# Pool for CPU-bound PDF parsing and analysis, created on first use (see get_pdf_pool)
+_pdf_pool = None
+_pdf_pool_lock = threading.Lock()
+
+
+def get_pdf_pool():
+    """Return the PDF analysis pool, creating it on first use.
+
+    Never built at import time: forkserver/spawn children import this module too.
+    """
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            if GEVENT_PATCHED:
+                # Under gunicorn's gevent worker multiprocessing does not mix with the patched
+                # stdlib, and greenlets would block the event loop, so use native OS threads
+                from gevent.threadpool import ThreadPoolExecutor as NativeThreadPoolExecutor
+                init_pdf_worker()  # torch threads are process-wide here
+                _pdf_pool = NativeThreadPoolExecutor(max_workers=PDF_WORKERS)
+            else:
+                # Worker processes (not limited by the GIL) start while scheduler/request/executor
+                # threads may hold locks, so never fork: use a forkserver (POSIX) or spawn (Windows)
+                context = multiprocessing.get_context(
+                    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn')
+                _pdf_pool = concurrent.futures.ProcessPoolExecutor(max_workers=PDF_WORKERS,
+                                                                   mp_context=context,
+                                                                   initializer=init_pdf_worker)
+            atexit.register(_pdf_pool.shutdown, wait=False)
+    return _pdf_pool
+
+# Single writer thread so background analysis results are written to SQLite one at a time
+db_writer = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+# Cleanup executors on exit
 import atexit
 atexit.register(executor.shutdown, wait=False)
+atexit.register(db_writer.shutdown, wait=False)
+
+
+# --- Database Connection ---
+# One long-lived connection per thread instead of a fresh connect() per request.
+# Background threads (executors, scheduler) keep theirs; request threads are short-lived,
+# so their connection goes back to a shared pool when the request ends.
+# Under gevent use the unpatched (OS-thread) local, otherwise every request greenlet
+# would open its own connection. sqlite3 calls never yield, so greenlets can share it.
+if GEVENT_PATCHED:
+    _db_local = monkey.get_original('threading', 'local')()
+else:
+    _db_local = threading.local()
+_db_pool = queue.LifoQueue(maxsize=DB_POOL_SIZE)
+
+
+def get_conn():
+    """Return this thread's SQLite connection, taking one from the pool or opening one."""
+    conn = getattr(_db_local, 'conn', None)
+    if conn is None:
+        try:
+            conn = _db_pool.get_nowait()
+        except queue.Empty:
+            conn = sqlite3.connect(DB_FILE, check_same_thread=False, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            # journal_mode=WAL is persistent and set once in init_db
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA cache_size=-65536")
+        _db_local.conn = conn
+    return conn
+
+
+@app.teardown_appcontext
+def release_conn(exc=None):
+    """Return the request thread's connection to the pool."""
+    if GEVENT_PATCHED:
+        return  # all greenlets already share the hub thread's connection
+    conn = getattr(_db_local, 'conn', None)
+    if conn is None:
+        return
+    _db_local.conn = None
+    if conn.in_transaction:
+        conn.execute("ROLLBACK")
+    try:
+        _db_pool.put_nowait(conn)
+    except queue.Full:
+        conn.close()
+
+
+def fetch_dicts(c):
+    """Fetch all remaining rows from a cursor as dicts, reading column names once."""
+    cols = [d[0] for d in c.description]
+    return [dict(zip(cols, row)) for row in c.fetchall()]
+
+
+def json_response(data, status=200):
+    """Serialize data to a JSON response, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return Response(orjson.dumps(data), status=status, mimetype='application/json')
+    return jsonify(data), status
 
 
 # --- Database Setup ---
+FTS_INSERT_TRIGGER_SQL = '''
+    CREATE TRIGGER IF NOT EXISTS announcements_ai AFTER INSERT ON announcements BEGIN
+        INSERT INTO announcements_fts(rowid, title, date_text, pdf_summary, translated_title, category)
+        VALUES (new.id, new.title, new.date_text, new.pdf_summary, new.translated_title, new.category);
+    END
+'''
+
+# Also created on demand by set_meta, for databases that init_db() never touched
+META_TABLE_SQL = 'CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)'
+
+
 def init_db():
-    conn = sqlite3.connect(DB_FILE)
+    conn = get_conn()
+    # WAL lets the request threads read while the scraper/PDF workers write (stored in the file)
+    conn.execute("PRAGMA journal_mode=WAL")
     c = conn.cursor()
     
     # Check if announcements table exists
@@ -95,6 +332,13 @@ def init_db():
             )
         ''')
     
+    # Indexes for category filtering (/api/data) and recency ordering
+    c.execute('CREATE INDEX IF NOT EXISTS idx_cat_id ON announcements(category, id DESC)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_crawled ON announcements(crawled_at DESC)')
+    
+    # Key/value store for sync state (e.g. the announcements page ETag)
+    c.execute(META_TABLE_SQL)
+    
     # Create FTS (Full-Text Search) table for comprehensive search
     try:
         c.execute('''
@@ -108,14 +352,15 @@ def init_db():
     
     # Create triggers to keep FTS in sync
     try:
+        c.execute(FTS_INSERT_TRIGGER_SQL)
+        # Recreate the update trigger so existing databases pick up the WHEN guard
+        c.execute('DROP TRIGGER IF EXISTS announcements_au')
         c.execute('''
-            CREATE TRIGGER IF NOT EXISTS announcements_ai AFTER INSERT ON announcements BEGIN
-                INSERT INTO announcements_fts(rowid, title, date_text, pdf_summary, translated_title, category)
-                VALUES (new.id, new.title, new.date_text, new.pdf_summary, new.translated_title, new.category);
-            END
-        ''')
-        c.execute('''
-            CREATE TRIGGER IF NOT EXISTS announcements_au AFTER UPDATE ON announcements BEGIN
+            CREATE TRIGGER announcements_au AFTER UPDATE ON announcements
+            WHEN old.title IS NOT new.title OR old.date_text IS NOT new.date_text
+              OR old.pdf_summary IS NOT new.pdf_summary OR old.translated_title IS NOT new.translated_title
+              OR old.category IS NOT new.category
+            BEGIN
                 INSERT INTO announcements_fts(announcements_fts, rowid, title, date_text, pdf_summary, translated_title, category)
                 VALUES ('delete', old.id, old.title, old.date_text, old.pdf_summary, old.translated_title, old.category);
                 INSERT INTO announcements_fts(rowid, title, date_text, pdf_summary, translated_title, category)
@@ -130,14 +375,54 @@ def init_db():
     except Exception as e:
         print(f"Trigger creation skipped (may already exist): {e}")
     
-    conn.commit()
-    conn.close()
+    c.close()
+
+
+def get_meta(key):
+    """Read a value from the meta table (None if unset or the table does not exist yet)."""
+    try:
+        row = get_conn().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return row[0] if row else None
+
+
+def set_meta(key, value):
+    """Store a value in the meta table; None removes the key."""
+    conn = get_conn()
+    conn.execute(META_TABLE_SQL)
+    if value is None:
+        conn.execute("DELETE FROM meta WHERE key = ?", (key,))
+    else:
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+
+def filter_unanalyzed(urls):
+    """Return the unique URLs (in order) that do not have a PDF summary yet."""
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        return []
+    placeholders = ','.join('?' * len(urls))
+    rows = get_conn().execute(
+        f"SELECT url FROM announcements WHERE url IN ({placeholders}) AND pdf_summary IS NOT NULL",
+        urls
+    ).fetchall()
+    analyzed = {row[0] for row in rows}
+    return [url for url in urls if url not in analyzed]
+
+
+def recent_unanalyzed(limit):
+    """Return URLs of the newest announcements that still have no PDF summary."""
+    rows = get_conn().execute(
+        "SELECT url FROM announcements WHERE pdf_summary IS NULL ORDER BY id DESC LIMIT ?",
+        (limit,)
+    ).fetchall()
+    return [row[0] for row in rows]
 
 
 def cleanup_old_announcements():
     """Remove oldest announcements if count exceeds MAX_ANNOUNCEMENTS."""
-    conn = sqlite3.connect(DB_FILE)
-    c = conn.cursor()
+    c = get_conn().cursor()
     try:
         # Get current count
         c.execute("SELECT COUNT(*) FROM announcements")
@@ -164,7 +449,6 @@ def cleanup_old_announcements():
                 c.execute("DELETE FROM announcements WHERE id < ?", (threshold_id,))
                 
                 deleted_count = c.rowcount
-                conn.commit()
                 print(f"--- [CLEANUP] Deleted {deleted_count} old announcements (kept latest {MAX_ANNOUNCEMENTS}) ---")
                 return deleted_count
         
@@ -173,46 +457,65 @@ def cleanup_old_announcements():
         print(f"Cleanup Error: {e}")
         return 0
     finally:
-        conn.close()
+        c.close()
 
 
-def save_announcement(date_text, title, url, pdf_summary=None, category=None, translated_title=None):
-    """Save announcement with optional PDF summary and category."""
-    conn = sqlite3.connect(DB_FILE)
-    c = conn.cursor()
+_sync_count = 0
+_sync_count_lock = threading.Lock()
+
+
+def maybe_optimize_fts():
+    """Compact the FTS5 index and run PRAGMA optimize every FTS_OPTIMIZE_EVERY syncs."""
+    global _sync_count
+    with _sync_count_lock:
+        _sync_count += 1
+        if _sync_count % FTS_OPTIMIZE_EVERY:
+            return False
+
+    conn = get_conn()
     try:
-        # Check if record exists
-        c.execute("SELECT id FROM announcements WHERE url = ?", (url,))
-        existing = c.fetchone()
-        
-        if existing:
-            # Update existing record with new summary data
-            if pdf_summary or category or translated_title:
-                c.execute("""
-                    UPDATE announcements 
-                    SET pdf_summary = COALESCE(?, pdf_summary),
-                        category = COALESCE(?, category),
-                        translated_title = COALESCE(?, translated_title)
-                    WHERE url = ?
-                """, (pdf_summary, category, translated_title, url))
-        else:
-            # Insert new record
-            c.execute("""
-                INSERT INTO announcements (date_text, title, url, pdf_summary, category, translated_title)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (date_text, title, url, pdf_summary, category, translated_title))
-        conn.commit()
+        conn.execute("BEGIN")
+        conn.execute("INSERT INTO announcements_fts(announcements_fts) VALUES('optimize')")
+        conn.execute("PRAGMA optimize")
+        conn.execute("COMMIT")
+        print("--- [MAINTENANCE] FTS index optimized ---")
+        return True
     except Exception as e:
-        print(f"DB Error: {e}")
-    finally:
-        conn.close()
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        print(f"FTS optimize error: {e}")
+        return False
+
+
+def save_announcements(rows):
+    """Insert scraped (date_text, title, url) rows in a single transaction; re-raises on failure."""
+    if not rows:
+        return
+    conn = get_conn()
+    # Large imports: skip the per-row FTS trigger and rebuild the index once afterwards
+    bulk = len(rows) > FTS_BULK_THRESHOLD
+    try:
+        conn.execute("BEGIN")
+        if bulk:
+            conn.execute("DROP TRIGGER IF EXISTS announcements_ai")
+        conn.executemany(
+            "INSERT OR IGNORE INTO announcements (date_text, title, url) VALUES (?, ?, ?)",
+            rows
+        )
+        if bulk:
+            conn.execute(FTS_INSERT_TRIGGER_SQL)
+            conn.execute("INSERT INTO announcements_fts(announcements_fts) VALUES('rebuild')")
+        conn.execute("COMMIT")
+    except Exception:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        # Let scrape_and_sync fail so it does not store the page validators
+        raise
 
 
 def comprehensive_search(query):
     """Enhanced search with support for various query patterns."""
-    conn = sqlite3.connect(DB_FILE)
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
+    c = get_conn().cursor()
     
     results = []
     
@@ -222,22 +525,28 @@ def comprehensive_search(query):
     if not query:
         # Return all records if no query
         c.execute("SELECT * FROM announcements ORDER BY id DESC LIMIT 100")
-        rows = c.fetchall()
-        conn.close()
-        return [dict(row) for row in rows]
+        results = fetch_dicts(c)
+        c.close()
+        return results
     
     # Strategy 1: Try FTS5 search for complex queries
     try:
         # Build FTS query - handle various patterns
         fts_query = build_fts_query(query)
+        # Run the MATCH on its own in a CTE so SQLite keeps the FTS5 index plan,
+        # rank by bm25 there, then join the (at most 100) rowids back to the table
         c.execute("""
-            SELECT a.* FROM announcements a
-            INNER JOIN announcements_fts fts ON a.id = fts.rowid
-            WHERE announcements_fts MATCH ?
-            ORDER BY a.id DESC LIMIT 100
+            WITH m AS (
+                SELECT rowid, bm25(announcements_fts) AS s
+                FROM announcements_fts
+                WHERE announcements_fts MATCH ?
+                ORDER BY s LIMIT 100
+            )
+            SELECT a.* FROM m
+            JOIN announcements a ON a.id = m.rowid
+            ORDER BY a.id DESC
         """, (fts_query,))
-        rows = c.fetchall()
-        results = [dict(row) for row in rows]
+        results = fetch_dicts(c)
     except Exception as e:
         print(f"FTS search failed (falling back to LIKE): {e}")
     
@@ -278,24 +587,21 @@ def comprehensive_search(query):
             if conditions:
                 query_sql = f"SELECT * FROM announcements WHERE {' AND '.join(conditions)} ORDER BY id DESC LIMIT 100"
                 c.execute(query_sql, params)
-                rows = c.fetchall()
-                results = [dict(row) for row in rows]
+                results = fetch_dicts(c)
             else:
                 # Simple fallback: just search title and date
                 search_term = f"%{query}%"
                 c.execute("SELECT * FROM announcements WHERE title LIKE ? OR date_text LIKE ? ORDER BY id DESC LIMIT 100",
                          (search_term, search_term))
-                rows = c.fetchall()
-                results = [dict(row) for row in rows]
+                results = fetch_dicts(c)
         except Exception as e:
             print(f"LIKE search failed: {e}")
             # Ultimate fallback
             search_term = f"%{query}%"
             c.execute("SELECT * FROM announcements WHERE title LIKE ? ORDER BY id DESC LIMIT 100", (search_term,))
-            rows = c.fetchall()
-            results = [dict(row) for row in rows]
+            results = fetch_dicts(c)
     
-    conn.close()
+    c.close()
     return results
 
 
@@ -319,15 +625,15 @@ def extract_date_patterns(query):
     patterns = []
     
     # DD-MM-YYYY or DD/MM/YYYY
-    matches = re.findall(r'\b(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})\b', query)
+    matches = _DATE_ANY.findall(query)
     patterns.extend(matches)
     
     # Year only (e.g., 2024)
-    year_matches = re.findall(r'\b(20\d{2})\b', query)
+    year_matches = _YEAR.findall(query)
     patterns.extend(year_matches)
     
     # Month patterns (Jan, Feb, etc.)
-    month_matches = re.findall(r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\b', query, re.I)
+    month_matches = _MONTH.findall(query)
     patterns.extend(month_matches)
     
     return patterns
@@ -336,8 +642,8 @@ def extract_date_patterns(query):
 def extract_text_parts(query):
     """Extract text parts from query, removing dates."""
     # Remove date patterns
-    cleaned = re.sub(r'\b\d{1,2}[-/]\d{1,2}[-/]\d{2,4}\b', ' ', query)
-    cleaned = re.sub(r'\b20\d{2}\b', ' ', cleaned)
+    cleaned = _DATE_ANY.sub(' ', query)
+    cleaned = _YEAR.sub(' ', cleaned)
     
     # Split into words
     words = [w.strip() for w in cleaned.split() if len(w.strip()) > 1]
@@ -368,48 +674,150 @@ def is_allowed_url(url):
         return False
 
 
+class PdfSpool:
+    """Download buffer that holds small PDFs in memory and spills larger ones to a named temp file."""
+
+    def __init__(self):
+        self.size = 0
+        self.magic = b''
+        self.buf = io.BytesIO()
+        self.path = None
+
+    def write(self, chunk):
+        """Append a chunk; returns False if the body would exceed PDF_MAX_BYTES."""
+        if self.size + len(chunk) > PDF_MAX_BYTES:
+            return False
+        if len(self.magic) < 5:
+            self.magic += chunk[:5 - len(self.magic)]
+        if self.path is None and self.size + len(chunk) > PDF_SPOOL_MAX_SIZE:
+            spill = tempfile.NamedTemporaryFile(suffix='.pdf', delete=False)
+            spill.write(self.buf.getvalue())
+            self.buf, self.path = spill, spill.name
+        self.buf.write(chunk)
+        self.size += len(chunk)
+        return True
+
+    def finish(self):
+        """Return the PDF as bytes, or as the temp file path once it has spilled to disk."""
+        if self.path is None:
+            return self.buf.getvalue()
+        self.buf.close()
+        return self.path
+
+    def discard(self):
+        """Drop the buffered body and any temp file."""
+        self.buf.close()
+        discard_pdf(self.path)
+
+
+def discard_pdf(pdf):
+    """Remove the temp file behind a spilled PDF (bytes payloads need no cleanup)."""
+    if isinstance(pdf, str):
+        try:
+            os.remove(pdf)
+        except OSError:
+            pass
+
+
+def check_pdf_download(url, spool, content_type):
+    """Validate a downloaded body is a PDF; return its bytes or temp file path, or None."""
+    # More lenient PDF validation:
+    # 1. Check content-type header
+    # 2. Check URL extension
+    # 3. Check PDF magic bytes (%PDF)
+    is_pdf = (
+        'pdf' in content_type.lower() or
+        url.lower().endswith('.pdf') or
+        spool.magic == b'%PDF-'
+    )
+    
+    if not is_pdf:
+        spool.discard()
+        return None
+    
+    return spool.finish()
+
+
 def download_pdf(url):
-    """Download PDF from URL and return as bytes."""
+    """Download PDF from URL; returns its bytes, or a temp file path for large PDFs (see PdfSpool)."""
     # Validate URL to prevent SSRF attacks
     if not is_allowed_url(url):
         print(f"PDF download blocked: URL not in allowlist - {url[:50]}")
         return None
     
+    # Stream into a spool instead of holding the whole body in memory
+    spool = PdfSpool()
     try:
-        response = requests.get(url, headers=HEADERS, timeout=PDF_DOWNLOAD_TIMEOUT, stream=True)
-        response.raise_for_status()
-        
-        content = response.content
-        
-        # More lenient PDF validation:
-        # 1. Check content-type header
-        # 2. Check URL extension
-        # 3. Check PDF magic bytes (%PDF)
-        content_type = response.headers.get('content-type', '').lower()
-        is_pdf = (
-            'pdf' in content_type or
-            url.lower().endswith('.pdf') or
-            content[:5] == b'%PDF-'
-        )
-        
-        if not is_pdf:
-            return None
-        
-        return io.BytesIO(content)
+        with SESSION.get(url, timeout=PDF_DOWNLOAD_TIMEOUT, stream=True) as response:
+            response.raise_for_status()
+            
+            for chunk in response.iter_content(65536):
+                if not spool.write(chunk):
+                    print(f"PDF download aborted: larger than {PDF_MAX_BYTES} bytes - {url[:50]}")
+                    spool.discard()
+                    return None
+            
+            return check_pdf_download(url, spool, response.headers.get('content-type', ''))
+    except Exception as e:
+        spool.discard()
+        print(f"PDF download error: {e}")
+        return None
+
+
+async def download_pdf_async(client, url):
+    """Async counterpart of download_pdf using a shared httpx client."""
+    if not is_allowed_url(url):
+        print(f"PDF download blocked: URL not in allowlist - {url[:50]}")
+        return None
+    
+    spool = PdfSpool()
+    try:
+        async with client.stream("GET", url) as response:
+            response.raise_for_status()
+            
+            async for chunk in response.aiter_bytes(65536):
+                if not spool.write(chunk):
+                    print(f"PDF download aborted: larger than {PDF_MAX_BYTES} bytes - {url[:50]}")
+                    spool.discard()
+                    return None
+            
+            return check_pdf_download(url, spool, response.headers.get('content-type', ''))
     except Exception as e:
+        spool.discard()
         print(f"PDF download error: {e}")
         return None
 
 
-def extract_pdf_text(pdf_bytes):
-    """Extract text from PDF bytes."""
-    if not PDF_AVAILABLE or pdf_bytes is None:
+async def fetch_pdfs(urls):
+    """Download all PDFs concurrently, multiplexed over HTTP/2 where the server supports it."""
+    limits = httpx.Limits(max_connections=PDF_FETCH_CONCURRENCY)
+    async with httpx.AsyncClient(http2=True, headers=HEADERS, timeout=PDF_DOWNLOAD_TIMEOUT,
+                                 limits=limits, follow_redirects=True) as client:
+        return await asyncio.gather(*(download_pdf_async(client, url) for url in urls))
+
+
+def extract_pdf_text(pdf):
+    """Extract text from PDF bytes or a PDF file path."""
+    if not PDF_AVAILABLE or pdf is None:
+        return None
+    
+    # PyMuPDF (C engine) is much faster for plain text; pdfplumber is the fallback
+    if PYMUPDF_AVAILABLE:
+        try:
+            doc = fitz.open(pdf) if isinstance(pdf, str) else fitz.open(stream=pdf, filetype="pdf")
+            with doc:
+                pages = (doc[i].get_text("text") for i in range(min(10, doc.page_count)))
+                return "\n".join(pages).strip()
+        except Exception as e:
+            print(f"PyMuPDF extraction error: {e}")
+    
+    if not PDFPLUMBER_AVAILABLE:
         return None
     
     try:
-        with pdfplumber.open(pdf_bytes) as pdf:
+        with pdfplumber.open(pdf if isinstance(pdf, str) else io.BytesIO(pdf)) as doc:
             text = ""
-            for page in pdf.pages[:10]:  # Limit to first 10 pages for performance
+            for page in doc.pages[:10]:  # Limit to first 10 pages for performance
                 page_text = page.extract_text()
                 if page_text:
                     text += page_text + "\n"
@@ -419,20 +827,110 @@ def extract_pdf_text(pdf_bytes):
         return None
 
 
+def memoize_on_text(maxsize=512):
+    """LRU-cache a pure function of text, keyed on a blake2b digest instead of the text itself."""
+    def decorator(func):
+        memo = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(text):
+            if not text:
+                return func(text)
+            key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+            with lock:
+                if key in memo:
+                    memo.move_to_end(key)
+                    return memo[key]
+            result = func(text)
+            with lock:
+                memo[key] = result
+                if len(memo) > maxsize:
+                    memo.popitem(last=False)
+            return result
+
+        wrapper.cache_clear = memo.clear
+        return wrapper
+    return decorator
+
+
+@memoize_on_text()
 def detect_language(text):
     """Detect language of text."""
-    if not LANGDETECT_AVAILABLE or not text:
+    if not text:
         return 'en'
     
+    sample = text[:1000]  # Use first 1000 chars for detection
     try:
-        return detect(text[:1000])  # Use first 1000 chars for detection
+        # Prefer the compiled CLD3 detector, fall back to pure-Python langdetect
+        if CLD3_AVAILABLE:
+            result = cld3.get_language(sample)
+            return result.language if result else 'en'
+        if LANGDETECT_AVAILABLE:
+            return detect(sample)
     except Exception:
-        return 'en'
+        pass
+    return 'en'
+
+
+_offline_model = None
+_offline_model_lock = threading.Lock()
+
+
+def get_offline_translator():
+    """Load the offline translation model once per process."""
+    global _offline_model
+    with _offline_model_lock:
+        if _offline_model is None:
+            tokenizer = AutoTokenizer.from_pretrained(TRANSLATION_MODEL)
+            model = AutoModelForSeq2SeqLM.from_pretrained(TRANSLATION_MODEL).eval()
+            _offline_model = (tokenizer, model)
+    return _offline_model
+
+
+def split_for_translation(text, max_chars=TRANSLATION_CHUNK_CHARS):
+    """Split text on whitespace into chunks short enough for the model's input window."""
+    chunks = []
+    current = []
+    length = 0
+    for word in text.split():
+        if current and length + len(word) + 1 > max_chars:
+            chunks.append(' '.join(current))
+            current = []
+            length = 0
+        current.append(word)
+        length += len(word) + 1
+    if current:
+        chunks.append(' '.join(current))
+    return chunks
+
+
+def translate_offline(text):
+    """Translate Hindi text to English locally, in batched forward passes."""
+    tokenizer, model = get_offline_translator()
+    chunks = split_for_translation(text[:TRANSLATION_MAX_CHARS])
+    translated_chunks = []
+    with torch.inference_mode():
+        for i in range(0, len(chunks), TRANSLATION_BATCH_SIZE):
+            batch = tokenizer(chunks[i:i+TRANSLATION_BATCH_SIZE], padding=True, truncation=True, return_tensors='pt')
+            output = model.generate(**batch)
+            translated_chunks.extend(tokenizer.batch_decode(output, skip_special_tokens=True))
+    return ' '.join(translated_chunks)
 
 
 def translate_text(text, target='en'):
     """Translate text to target language."""
-    if not TRANSLATOR_AVAILABLE or not text:
+    if not text:
+        return text
+    
+    # Prefer the local model (Hindi -> English only), fall back to Google Translate
+    if OFFLINE_TRANSLATOR_AVAILABLE and target == 'en':
+        try:
+            return translate_offline(text)
+        except Exception as e:
+            print(f"Offline translation error: {e}")
+    
+    if not TRANSLATOR_AVAILABLE:
         return text
     
     try:
@@ -454,6 +952,31 @@ def translate_text(text, target='en'):
         return text
 
 
+# Document category keywords, checked in priority order
+DOCUMENT_CATEGORIES = {
+    "Examination": ['exam', 'examination', 'paper code', 'paper-code', 'answer sheet', 'question paper', 
+                   'time table', 'timetable', 'date sheet', 'datesheet', 'hall ticket', 'admit card',
+                   'semester', 'internal', 'external', 'mid-term', 'end-term', 'practical', 'viva'],
+    "Academic Calendar": ['academic calendar', 'holiday', 'vacation', 'session', 'semester start',
+                         'semester end', 'registration', 'enrollment'],
+    "Result": ['result', 'marks', 'grade', 'cgpa', 'sgpa', 'transcript', 'marksheet'],
+    "Fee Notice": ['fee', 'payment', 'dues', 'scholarship', 'financial', 'refund'],
+    "Admission": ['admission', 'intake', 'enrollment', 'counseling', 'merit list'],
+    "Uniform/Dress Code": ['uniform', 'dress code', 'dress-code', 'attire', 'id card'],
+    "Event": ['event', 'festival', 'function', 'celebration', 'cultural', 'sports'],
+    "Assignment/Project": ['assignment', 'project', 'submission', 'deadline', 'thesis', 'dissertation'],
+    "Internship/Placement": ['internship', 'placement', 'job', 'recruitment', 'campus drive', 'interview'],
+    "Important Dates": ['important date', 'last date', 'deadline', 'schedule', 'timing']
+}
+
+# One compiled alternation per category so each check is a single scan in C
+_CATEGORY_PATTERNS = [
+    (category, re.compile('|'.join(map(re.escape, keywords))))
+    for category, keywords in DOCUMENT_CATEGORIES.items()
+]
+
+
+@memoize_on_text()
 def categorize_document(text):
     """Categorize document based on content."""
     if not text:
@@ -461,30 +984,14 @@ def categorize_document(text):
     
     text_lower = text.lower()
     
-    # Category patterns
-    categories = {
-        "Examination": ['exam', 'examination', 'paper code', 'paper-code', 'answer sheet', 'question paper', 
-                       'time table', 'timetable', 'date sheet', 'datesheet', 'hall ticket', 'admit card',
-                       'semester', 'internal', 'external', 'mid-term', 'end-term', 'practical', 'viva'],
-        "Academic Calendar": ['academic calendar', 'holiday', 'vacation', 'session', 'semester start',
-                             'semester end', 'registration', 'enrollment'],
-        "Result": ['result', 'marks', 'grade', 'cgpa', 'sgpa', 'transcript', 'marksheet'],
-        "Fee Notice": ['fee', 'payment', 'dues', 'scholarship', 'financial', 'refund'],
-        "Admission": ['admission', 'intake', 'enrollment', 'counseling', 'merit list'],
-        "Uniform/Dress Code": ['uniform', 'dress code', 'dress-code', 'attire', 'id card'],
-        "Event": ['event', 'festival', 'function', 'celebration', 'cultural', 'sports'],
-        "Assignment/Project": ['assignment', 'project', 'submission', 'deadline', 'thesis', 'dissertation'],
-        "Internship/Placement": ['internship', 'placement', 'job', 'recruitment', 'campus drive', 'interview'],
-        "Important Dates": ['important date', 'last date', 'deadline', 'schedule', 'timing']
-    }
-    
-    for category, keywords in categories.items():
-        if any(kw in text_lower for kw in keywords):
+    for category, pattern in _CATEGORY_PATTERNS:
+        if pattern.search(text_lower):
             return category
     
     return "General Notice"
 
 
+@memoize_on_text()
 def extract_key_info(text):
     """Extract key information from PDF text."""
     if not text:
@@ -494,23 +1001,23 @@ def extract_key_info(text):
     text_lower = text.lower()
     
     # Extract paper codes (various formats)
-    paper_codes = re.findall(r'\b([A-Z]{2,4}[-\s]?\d{3,4}[-\s]?[A-Z]?)\b', text, re.I)
+    paper_codes = _PAPER_CODE.findall(text)
     if paper_codes:
         info['paper_codes'] = list(set(paper_codes[:10]))
     
     # Extract dates
-    dates = re.findall(r'\b(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})\b', text)
-    dates += re.findall(r'\b(\d{1,2}\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+\d{2,4})\b', text, re.I)
+    dates = _DATE_ANY.findall(text)
+    dates += _DATE_MONTH_NAME.findall(text)
     if dates:
         info['dates'] = list(set(dates[:20]))
     
     # Extract times
-    times = re.findall(r'\b(\d{1,2}[:\.]?\d{2}\s*(?:am|pm|AM|PM)?)\b', text)
+    times = _TIME.findall(text)
     if times:
         info['times'] = list(set(times[:10]))
     
     # Extract subject names (common patterns)
-    subjects = re.findall(r'\b(mathematics|physics|chemistry|english|computer|science|programming|data\s+structure|algorithm|database|network|software|operating\s+system)\b', text_lower)
+    subjects = _SUBJECTS.findall(text_lower)
     if subjects:
         info['subjects'] = list(set(subjects[:10]))
     
@@ -550,64 +1057,132 @@ def generate_pdf_summary(text, key_info, category):
     return " | ".join(summary_parts)
 
 
-def analyze_pdf_async(url):
-    """Analyze PDF asynchronously and update database."""
-    def task():
+def analyze_pdf_content(pdf):
+    """Extract, translate and analyze a PDF (bytes or temp file path). Runs in the process pool."""
+    text = extract_pdf_text(pdf)
+    if not text:
+        return None
+    
+    # Detect language and translate if Hindi
+    lang = detect_language(text)
+    translated_text = None
+    if lang == 'hi':
+        translated_text = translate_text(text, 'en')
+    
+    # Categorize and extract info
+    analysis_text = translated_text or text
+    category = categorize_document(analysis_text)
+    key_info = extract_key_info(analysis_text)
+    summary = generate_pdf_summary(analysis_text, key_info, category)
+    
+    return {
+        "summary": summary,
+        "category": category,
+        "key_info": key_info,
+        "language": lang
+    }
+
+
+def save_pdf_analysis(url, summary, category):
+    """Store a PDF summary and category for an announcement."""
+    c = get_conn().cursor()
+    c.execute("""
+        UPDATE announcements 
+        SET pdf_summary = ?, category = ?
+        WHERE url = ?
+    """, (summary, category, url))
+    c.close()
+    cache.clear()
+
+
+def analyze_pdfs_async(urls):
+    """Download PDFs on the I/O pool, analyze them on the process pool, write results on the DB writer."""
+    def write_result(url, result):
         try:
-            pdf_bytes = download_pdf(url)
-            if not pdf_bytes:
-                return
-            
-            text = extract_pdf_text(pdf_bytes)
-            if not text:
-                return
-            
-            # Detect language and translate if Hindi
-            lang = detect_language(text)
-            translated_text = None
-            if lang == 'hi':
-                translated_text = translate_text(text, 'en')
-            
-            # Categorize and extract info
-            analysis_text = translated_text or text
-            category = categorize_document(analysis_text)
-            key_info = extract_key_info(analysis_text)
-            summary = generate_pdf_summary(analysis_text, key_info, category)
-            
-            # Update database
-            conn = sqlite3.connect(DB_FILE)
-            c = conn.cursor()
-            c.execute("""
-                UPDATE announcements 
-                SET pdf_summary = ?, category = ?
-                WHERE url = ?
-            """, (summary, category, url))
-            conn.commit()
-            conn.close()
-            
-            print(f"--- [PDF] Analyzed: {url[:50]}... Category: {category} ---")
+            save_pdf_analysis(url, result['summary'], result['category'])
+            print(f"--- [PDF] Analyzed: {url[:50]}... Category: {result['category']} ---")
+        except Exception as e:
+            print(f"PDF analysis error: {e}")
+    
+    def on_analyzed(url, pdf, future):
+        discard_pdf(pdf)
+        try:
+            result = future.result()
         except Exception as e:
             print(f"PDF analysis error: {e}")
+            return
+        if result:
+            db_writer.submit(write_result, url, result)
     
-    executor.submit(task)
+    def submit_analysis(url, pdf):
+        if not pdf:
+            return
+        try:
+            # Spilled PDFs cross to the worker as a path, not as their contents
+            callback = functools.partial(on_analyzed, url, pdf)
+            if GEVENT_PATCHED:
+                # gevent runs done-callbacks inside the event loop, where blocking is not allowed
+                callback = functools.partial(gevent.spawn, callback)
+            get_pdf_pool().submit(analyze_pdf_content, pdf).add_done_callback(callback)
+        except Exception as e:
+            discard_pdf(pdf)
+            print(f"PDF analysis error: {e}")
+    
+    def on_downloaded(url, future):
+        submit_analysis(url, future.result())
+    
+    def on_all_downloaded(future):
+        try:
+            results = future.result()
+        except Exception as e:
+            print(f"PDF download error: {e}")
+            return
+        for url, pdf in zip(urls, results):
+            submit_analysis(url, pdf)
+    
+    if HTTPX_AVAILABLE and not GEVENT_PATCHED:
+        # Fan out every download at once instead of 4 at a time
+        # (under gevent the patched SESSION already downloads cooperatively)
+        executor.submit(asyncio.run, fetch_pdfs(urls)).add_done_callback(on_all_downloaded)
+    else:
+        for url in urls:
+            executor.submit(download_pdf, url).add_done_callback(functools.partial(on_downloaded, url))
 
 
 # --- Scraper Logic (Live Fetch) ---
-def scrape_and_sync(analyze_pdfs=True):
+def scrape_and_sync(analyze_pdfs=True, force=False):
     """Fetches latest data from Galgotias and updates DB."""
     print("--- [SYSTEM] FETCHING LIVE DATA... ---")
     try:
-        resp = requests.get(EXAM_URL, headers=HEADERS, timeout=REQUEST_TIMEOUT)
+        # Conditional GET: the server answers 304 with no body if the page is unchanged
+        headers = {}
+        if not force:
+            etag = get_meta('exam_page_etag')
+            last_modified = get_meta('exam_page_last_modified')
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        
+        resp = SESSION.get(EXAM_URL, headers=headers, timeout=REQUEST_TIMEOUT)
+        if resp.status_code == 304:
+            print("--- [SYSTEM] NO CHANGES SINCE LAST SYNC (304). ---")
+            # Page unchanged, but retry PDFs whose earlier download or analysis failed
+            if analyze_pdfs and PDF_AVAILABLE:
+                analyze_pdfs_async(recent_unanalyzed(20))
+            return True, 0
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(resp.text, HTML_PARSER)
+        anchors = soup.select("a[href]")
 
         # Strategy 1: Find 'View Detail' links and parse parent text
-        links = soup.find_all("a", string=re.compile(r"View Detail", re.I))
+        links = [a for a in anchors if _VIEW_DETAIL.search(a.get_text())]
         
         # Strategy 2: Also look for direct PDF links
-        pdf_links = soup.find_all("a", href=re.compile(r"\.pdf", re.I))
+        pdf_links = [a for a in anchors if _PDF_HREF.search(a["href"])]
 
         count = 0
+        rows = []
         urls_to_analyze = []
         
         for link in links:
@@ -624,19 +1199,19 @@ def scrape_and_sync(analyze_pdfs=True):
             raw_text = container.get_text(" ", strip=True)
 
             # Extract Date (DD-MM-YYYY or other formats)
-            date_match = re.search(r"\b(\d{2}[-/]\d{2}[-/]\d{4})\b", raw_text)
+            date_match = _DATE_DMY.search(raw_text)
             
             if not date_match:
                 # Try alternate date format
-                date_match = re.search(r"\b(\d{1,2}\s+\w+\s+\d{4})\b", raw_text)
+                date_match = _DATE_WORDS.search(raw_text)
 
             if date_match:
                 date_text = date_match.group(1)
                 # Remove Date and 'View Detail' to get Title
                 title = raw_text.replace(date_text, "").replace("View Detail", "").strip()
-                title = re.sub(r"^[\.\-\:\s]+", "", title)  # Clean leading punctuation
+                title = _LEAD_PUNCT.sub("", title)  # Clean leading punctuation
 
-                save_announcement(date_text, title, href)
+                rows.append((date_text, title, href))
                 urls_to_analyze.append(href)
                 count += 1
 
@@ -658,25 +1233,34 @@ def scrape_and_sync(analyze_pdfs=True):
             # Use current date if not found
             date_text = datetime.now().strftime("%d-%m-%Y")
             
-            save_announcement(date_text, title, href)
+            rows.append((date_text, title, href))
             urls_to_analyze.append(href)
             count += 1
 
-        # Trigger async PDF analysis for new URLs
+        save_announcements(rows)
+
+        # Trigger async PDF analysis for URLs that have not been analyzed yet
         if analyze_pdfs and PDF_AVAILABLE:
-            for url in urls_to_analyze[:20]:  # Limit to 20 for performance
-                analyze_pdf_async(url)
+            analyze_pdfs_async(filter_unanalyzed(urls_to_analyze)[:20])  # Limit to 20 for performance
 
         # Cleanup old announcements if we exceed the limit
         deleted = cleanup_old_announcements()
+
+        # Periodic FTS maintenance
+        maybe_optimize_fts()
         
         # Get final count after cleanup
-        conn = sqlite3.connect(DB_FILE)
-        c = conn.cursor()
+        c = get_conn().cursor()
         c.execute("SELECT COUNT(*) FROM announcements")
         total_count = c.fetchone()[0]
-        conn.close()
+        c.close()
         
+        cache.clear()
+
+        # Remember the page validators only once the sync has been applied
+        set_meta('exam_page_etag', resp.headers.get('ETag'))
+        set_meta('exam_page_last_modified', resp.headers.get('Last-Modified'))
+
         print(f"--- [SYSTEM] SYNC COMPLETE. {count} ITEMS PROCESSED. ---")
         print(f"--- [SYSTEM] TOTAL ANNOUNCEMENTS IN DB: {total_count} (max: {MAX_ANNOUNCEMENTS}) ---")
         return True, count
@@ -685,28 +1269,54 @@ def scrape_and_sync(analyze_pdfs=True):
         return False, 0
 
 
+_scheduler_lock = None
+
+
+def acquire_scheduler_lock():
+    """Try to become the process that runs the scheduler; True if this process holds the lock."""
+    global _scheduler_lock
+    import fcntl  # POSIX only, like gunicorn itself
+    lock = open(SCHEDULER_LOCK_FILE, 'w')
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock.close()
+        return False
+    # Kept open for the life of the process; the OS releases it if the worker dies
+    _scheduler_lock = lock
+    return True
+
+
+def start_scheduler():
+    """Run scrape_and_sync in the background now and every SYNC_INTERVAL_MINUTES."""
+    scheduler = BackgroundScheduler(daemon=True)
+    scheduler.add_job(scrape_and_sync, 'interval', minutes=SYNC_INTERVAL_MINUTES,
+                      next_run_time=datetime.now(), max_instances=1, coalesce=True)
+    scheduler.start()
+    atexit.register(scheduler.shutdown, wait=False)
+    return scheduler
+
+
 # --- Routes ---
 
 @app.route('/')
+@cache.cached(timeout=60)
 def index():
-    conn = sqlite3.connect(DB_FILE)
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
+    c = get_conn().cursor()
 
     # Check if DB is empty, if so, scrape immediately
     c.execute("SELECT COUNT(*) FROM announcements")
     total_count = c.fetchone()[0]
     if total_count == 0:
-        scrape_and_sync()
+        scrape_and_sync(force=True)
         # Re-count after sync
         c.execute("SELECT COUNT(*) FROM announcements")
         total_count = c.fetchone()[0]
 
     # Get latest 100 items with all fields
     c.execute("SELECT * FROM announcements ORDER BY id DESC LIMIT 100")
-    rows = c.fetchall()
-    data = [dict(row) for row in rows]
-    conn.close()
+    data = fetch_dicts(c)
+    c.close()
 
     return render_template('index.html', initial_data=data, total_count=total_count, max_limit=MAX_ANNOUNCEMENTS)
 
@@ -716,13 +1326,12 @@ def sync():
     success, count = scrape_and_sync()
     
     # Get total count from database
-    conn = sqlite3.connect(DB_FILE)
-    c = conn.cursor()
+    c = get_conn().cursor()
     c.execute("SELECT COUNT(*) FROM announcements")
     total_count = c.fetchone()[0]
-    conn.close()
+    c.close()
     
-    return jsonify({
+    return json_response({
         "status": "success" if success else "error",
         "count": count,
         "total": total_count,
@@ -732,6 +1341,7 @@ def sync():
 
 
 @app.route('/api/search')
+@cache.cached(timeout=30, query_string=True)
 def search():
     q = request.args.get('q', '')
 
@@ -744,7 +1354,7 @@ def search():
 
     # Use comprehensive search
     results = comprehensive_search(q)
-    return jsonify(results)
+    return json_response(results)
 
 
 @app.route('/api/analyze', methods=['POST'])
@@ -754,18 +1364,16 @@ def analyze_pdf():
     url = data.get('url', '')
     
     if not url:
-        return jsonify({"error": "No URL provided"}), 400
+        return json_response({"error": "No URL provided"}, 400)
     
     # Check if we already have analysis
-    conn = sqlite3.connect(DB_FILE)
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
+    c = get_conn().cursor()
     c.execute("SELECT pdf_summary, category FROM announcements WHERE url = ?", (url,))
     row = c.fetchone()
-    conn.close()
+    c.close()
     
     if row and row['pdf_summary']:
-        return jsonify({
+        return json_response({
             "summary": row['pdf_summary'],
             "category": row['category'],
             "cached": True
@@ -773,58 +1381,40 @@ def analyze_pdf():
     
     # Perform new analysis
     try:
-        pdf_bytes = download_pdf(url)
-        if not pdf_bytes:
-            return jsonify({"error": "Could not download PDF"}), 400
-        
-        text = extract_pdf_text(pdf_bytes)
-        if not text:
-            return jsonify({"error": "Could not extract text from PDF"}), 400
-        
-        # Detect language and translate if Hindi
-        lang = detect_language(text)
-        translated_text = None
-        if lang == 'hi':
-            translated_text = translate_text(text, 'en')
+        pdf = download_pdf(url)
+        if not pdf:
+            return json_response({"error": "Could not download PDF"}, 400)
         
-        # Categorize and extract info
-        analysis_text = translated_text or text
-        category = categorize_document(analysis_text)
-        key_info = extract_key_info(analysis_text)
-        summary = generate_pdf_summary(analysis_text, key_info, category)
+        try:
+            result = analyze_pdf_content(pdf)
+        finally:
+            discard_pdf(pdf)
+        if not result:
+            return json_response({"error": "Could not extract text from PDF"}, 400)
         
         # Update database
-        conn = sqlite3.connect(DB_FILE)
-        c = conn.cursor()
-        c.execute("""
-            UPDATE announcements 
-            SET pdf_summary = ?, category = ?
-            WHERE url = ?
-        """, (summary, category, url))
-        conn.commit()
-        conn.close()
+        save_pdf_analysis(url, result['summary'], result['category'])
         
-        return jsonify({
-            "summary": summary,
-            "category": category,
-            "key_info": key_info,
-            "language_detected": lang,
-            "translated": lang == 'hi',
+        return json_response({
+            "summary": result['summary'],
+            "category": result['category'],
+            "key_info": result['key_info'],
+            "language_detected": result['language'],
+            "translated": result['language'] == 'hi',
             "cached": False
         })
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, 500)
 
 
 @app.route('/api/data')
+@cache.cached(timeout=30, query_string=True)
 def get_data():
     """Get all announcements data with optional filtering."""
     category = request.args.get('category', '')
     limit = min(int(request.args.get('limit', 100)), 500)
     
-    conn = sqlite3.connect(DB_FILE)
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
+    c = get_conn().cursor()
     
     if category:
         c.execute("SELECT * FROM announcements WHERE category = ? ORDER BY id DESC LIMIT ?", 
@@ -832,40 +1422,43 @@ def get_data():
     else:
         c.execute("SELECT * FROM announcements ORDER BY id DESC LIMIT ?", (limit,))
     
-    rows = c.fetchall()
-    data = [dict(row) for row in rows]
-    conn.close()
+    data = fetch_dicts(c)
+    c.close()
     
-    return jsonify(data)
+    return json_response(data)
 
 
 @app.route('/api/categories')
+@cache.cached(timeout=60)
 def get_categories():
     """Get list of all categories."""
-    conn = sqlite3.connect(DB_FILE)
-    c = conn.cursor()
+    c = get_conn().cursor()
     c.execute("SELECT DISTINCT category FROM announcements WHERE category IS NOT NULL")
     categories = [row[0] for row in c.fetchall()]
-    conn.close()
-    return jsonify(categories)
+    c.close()
+    return json_response(categories)
 
 
 @app.route('/health')
 def health():
     """Health check endpoint."""
-    return jsonify({
+    return json_response({
         "status": "healthy",
         "pdf_support": PDF_AVAILABLE,
-        "translation_support": TRANSLATOR_AVAILABLE,
-        "language_detection": LANGDETECT_AVAILABLE
+        "translation_support": OFFLINE_TRANSLATOR_AVAILABLE or TRANSLATOR_AVAILABLE,
+        "language_detection": CLD3_AVAILABLE or LANGDETECT_AVAILABLE
     })
 
 
 if __name__ == '__main__':
+    # Needed for the PDF process pool in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     init_db()
-    # OPTIONAL: Force a fresh scrape every time server restarts
-    scrape_and_sync(analyze_pdfs=False)  # Don't analyze on startup for faster load
     # Debug mode should be disabled in production via environment variable
     debug_mode = os.environ.get('FLASK_DEBUG', 'false').lower() == 'true'
+    # Sync in the background so the server starts immediately; under the debug
+    # reloader only the child process (WERKZEUG_RUN_MAIN) schedules the job
+    if not debug_mode or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_scheduler()
     port = int(os.environ.get('PORT', 5007))
     app.run(debug=debug_mode, port=port, threaded=True)
@@ -8,22 +8,78 @@ for deployment to GitHub Pages.
 import os
 import re
 import json
+import pstats
+import cProfile
+import tracemalloc
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
 from datetime import datetime
 
+# Fast JSON encoding for data.json (falls back to the stdlib json module)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# HTTP/2 client (falls back to the requests session below)
+try:
+    import httpx
+    import h2  # noqa: F401  (HTTP/2 support for httpx)
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# HTML parser: lxml (C) when installed, else the pure-Python stdlib parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
 # Configuration
 BASE_URL = "https://www.galgotiasuniversity.edu.in"
 EXAM_URL = f"{BASE_URL}/p/announcements/examination-announcement"
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 }
+# The announcements page is served as UTF-8; saying so skips charset sniffing
+SOURCE_ENCODING = "utf-8"
 OUTPUT_DIR = "static_site"
+# ETag / Last-Modified of the last page we built from (dotfile, so Pages does not publish it)
+HTTP_CACHE_PATH = os.path.join(OUTPUT_DIR, ".cache.json")
+
+# Shared HTTP session: keeps the TCP/TLS connection alive across requests
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=3))
+
+# Prefer httpx over HTTP/2 (multiplexed streams, compressed headers) when installed
+if HTTPX_AVAILABLE:
+    HTTP_CLIENT = httpx.Client(http2=True, headers=HEADERS, timeout=30.0, follow_redirects=True,
+                               limits=httpx.Limits(max_keepalive_connections=8))
+else:
+    HTTP_CLIENT = SESSION
 
 # Maximum number of announcements to keep
 # When this limit is reached, oldest announcements will be automatically removed
 MAX_ANNOUNCEMENTS = 470
 
+# Precompiled patterns used while parsing the announcements page
+_DATE_NUM = re.compile(r"\b(\d{2}[-/]\d{2}[-/]\d{4})\b")
+_DATE_WORD = re.compile(r"\b(\d{1,2}\s+\w+\s+\d{4})\b")
+_LEAD_PUNCT = re.compile(r"^[\.\-\:\s]+")
+_VIEW_DETAIL = re.compile(r"View Detail", re.I)
+_PDF_HREF = re.compile(r"\.pdf", re.I)
+
+# Only build the <body> subtree; <head> scripts, styles and meta tags are never queried.
+# (Straining to <a> alone would drop the parent containers that hold each date/title.)
+_BODY_ONLY = SoupStrainer("body")
+
+# HTML/attribute escaping in a single str.translate pass per string
+_ATTR_TT = str.maketrans({'&': '&amp;', '"': '&quot;', '<': '&lt;', '>': '&gt;', "'": '&#39;'})
+
 
 def parse_date_for_sorting(date_text):
     """Parse date text to a sortable format. Returns a datetime object for sorting."""
@@ -59,18 +115,54 @@ def parse_date_for_sorting(date_text):
 
 
 
-def fetch_announcements():
-    """Fetch announcements from the university website."""
+def load_http_cache():
+    """Load the saved response validators, or {} if there is no built site to reuse."""
+    if not os.path.exists(os.path.join(OUTPUT_DIR, "index.html")):
+        return {}
+    try:
+        with open(HTTP_CACHE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_http_cache(http_cache):
+    """Persist the response validators for the next run."""
+    with open(HTTP_CACHE_PATH, "w", encoding="utf-8") as f:
+        json.dump(http_cache, f)
+
+
+def fetch_announcements(http_cache=None):
+    """Fetch announcements from the university website.
+
+    Returns None when the page is unchanged since the validators in http_cache.
+    """
     print("--- [SYSTEM] FETCHING LIVE DATA... ---")
     announcements = []
     
     try:
-        resp = requests.get(EXAM_URL, headers=HEADERS, timeout=30)
+        headers = {}
+        if http_cache:
+            if http_cache.get("etag"):
+                headers["If-None-Match"] = http_cache["etag"]
+            if http_cache.get("last_modified"):
+                headers["If-Modified-Since"] = http_cache["last_modified"]
+        resp = HTTP_CLIENT.get(EXAM_URL, headers=headers, timeout=30)
+        if resp.status_code == 304:
+            print("--- [SYSTEM] NOT MODIFIED (304), SKIPPING PARSE ---")
+            return None
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
+        if http_cache is not None:
+            http_cache["etag"] = resp.headers.get("ETag")
+            http_cache["last_modified"] = resp.headers.get("Last-Modified")
+        soup = BeautifulSoup(resp.content, HTML_PARSER, parse_only=_BODY_ONLY,
+                             from_encoding=SOURCE_ENCODING)
+
+        # URLs already collected, for O(1) duplicate checks
+        seen_urls = set()
 
         # Strategy 1: Find 'View Detail' links
-        links = soup.find_all("a", string=re.compile(r"View Detail", re.I))
+        links = soup.find_all("a", string=_VIEW_DETAIL)
 
         for link in links:
             href = link.get("href", "").strip()
@@ -78,30 +170,33 @@ def fetch_announcements():
                 continue
             if not href.startswith("http"):
                 href = BASE_URL + href
+            if href in seen_urls:
+                continue
 
             container = link.parent
             if not container:
                 continue
             raw_text = container.get_text(" ", strip=True)
 
-            date_match = re.search(r"\b(\d{2}[-/]\d{2}[-/]\d{4})\b", raw_text)
+            date_match = _DATE_NUM.search(raw_text)
             if not date_match:
-                date_match = re.search(r"\b(\d{1,2}\s+\w+\s+\d{4})\b", raw_text)
+                date_match = _DATE_WORD.search(raw_text)
 
             if date_match:
                 date_text = date_match.group(1)
                 title = raw_text.replace(date_text, "").replace("View Detail", "").strip()
-                title = re.sub(r"^[\.\-\:\s]+", "", title)
+                title = _LEAD_PUNCT.sub("", title)
 
+                seen_urls.add(href)
                 announcements.append({
                     "date_text": date_text,
                     "title": title,
                     "url": href,
-                    "category": categorize_title(title)
                 })
 
         # Strategy 2: Also look for direct PDF links
-        pdf_links = soup.find_all("a", href=re.compile(r"\.pdf", re.I))
+        pdf_links = soup.find_all("a", href=_PDF_HREF)
+        today = datetime.now().strftime("%d-%m-%Y")
         for link in pdf_links:
             href = link.get("href", "").strip()
             if not href:
@@ -110,8 +205,9 @@ def fetch_announcements():
                 href = BASE_URL + href
             
             # Check if we already have this URL
-            if any(a["url"] == href for a in announcements):
+            if href in seen_urls:
                 continue
+            seen_urls.add(href)
             
             title = link.get_text(strip=True) or "PDF Document"
             if title in ["View Detail", "Download", "Click Here"]:
@@ -119,13 +215,12 @@ def fetch_announcements():
                 if parent:
                     title = parent.get_text(" ", strip=True)[:100]
             
-            date_text = datetime.now().strftime("%d-%m-%Y")
+            date_text = today
             
             announcements.append({
                 "date_text": date_text,
                 "title": title,
                 "url": href,
-                "category": categorize_title(title)
             })
 
         # Sort announcements by date (most recent first) to ensure we keep the newest ones
@@ -136,6 +231,10 @@ def fetch_announcements():
             print(f"--- [CLEANUP] Limiting announcements from {len(announcements)} to {MAX_ANNOUNCEMENTS} (keeping most recent) ---")
             announcements = announcements[:MAX_ANNOUNCEMENTS]
 
+        # Categorize only the survivors; dropped items never pay for the keyword scan
+        for item in announcements:
+            item["category"] = categorize_title(item["title"])
+
         print(f"--- [SYSTEM] FETCHED {len(announcements)} ANNOUNCEMENTS ---")
         return announcements
         
@@ -144,83 +243,30 @@ def fetch_announcements():
         return []
 
 
+# Title category keywords, checked in priority order (built once, not per call)
+TITLE_CATEGORIES = (
+    ("Examination", ('exam', 'examination', 'paper code', 'time table', 'datesheet', 'hall ticket', 'admit card')),
+    ("Result", ('result', 'marks', 'grade', 'cgpa', 'transcript')),
+    ("Academic Calendar", ('academic calendar', 'holiday', 'vacation', 'session')),
+    ("Fee Notice", ('fee', 'payment', 'dues', 'scholarship')),
+    ("Admission", ('admission', 'intake', 'enrollment', 'counseling')),
+)
+
+
 def categorize_title(title):
     """Categorize announcement based on title."""
     title_lower = title.lower()
     
-    categories = {
-        "Examination": ['exam', 'examination', 'paper code', 'time table', 'datesheet', 'hall ticket', 'admit card'],
-        "Result": ['result', 'marks', 'grade', 'cgpa', 'transcript'],
-        "Academic Calendar": ['academic calendar', 'holiday', 'vacation', 'session'],
-        "Fee Notice": ['fee', 'payment', 'dues', 'scholarship'],
-        "Admission": ['admission', 'intake', 'enrollment', 'counseling'],
-    }
-    
-    for category, keywords in categories.items():
-        if any(kw in title_lower for kw in keywords):
-            return category
+    for category, keywords in TITLE_CATEGORIES:
+        for kw in keywords:
+            if kw in title_lower:
+                return category
     
     return "General Notice"
 
 
-def generate_static_html(announcements):
-    """Generate static HTML file with the announcements."""
-    
-    # Generate card HTML
-    cards_html = ""
-    if announcements:
-        for item in announcements:
-            category_html = f'<span class="card-category">{item.get("category", "")}</span>' if item.get("category") else ''
-            cards_html += f'''
-            <div class="exam-card" data-url="{item['url']}">
-                <div class="card-header">
-                    <div>
-                        <div class="card-date">{item['date_text']}</div>
-                        <div class="card-title">{item['title']}</div>
-                    </div>
-                    {category_html}
-                </div>
-            </div>
-            '''
-    else:
-        cards_html = '<div style="text-align:center; color: #666; margin-top: 20px;">[ NO RECORDS FOUND ]</div>'
-    
-    # Generate a complete static page
-    html_content = generate_full_static_html(announcements)
-    
-    return html_content
-
-
-def generate_full_static_html(announcements):
-    """Generate a complete static HTML page with all features from PR #2."""
-    
-    # Generate announcement cards
-    cards_html = ""
-    if announcements:
-        for item in announcements:
-            category_html = f'<span class="card-category">{item.get("category", "")}</span>' if item.get("category") else ''
-            # Escape special characters in title and URL for HTML and JavaScript
-            title = item['title'].replace('&', '&amp;').replace('"', '&quot;').replace('<', '&lt;').replace('>', '&gt;')
-            date_text = item['date_text']
-            
-            cards_html += f'''
-            <div class="exam-card" data-url="{item['url'].replace('"', '&quot;')}" onclick="openPdf(this.dataset.url)">
-                <div class="card-header">
-                    <div>
-                        <div class="card-date">{date_text}</div>
-                        <div class="card-title">{title}</div>
-                    </div>
-                    {category_html}
-                </div>
-            </div>
-            '''
-    else:
-        cards_html = '<div style="text-align:center; color: #666; margin-top: 20px;">[ NO RECORDS FOUND - CHECK BACK LATER ]</div>'
-
-    # Last updated timestamp
-    last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
-    
-    html = f'''<!DOCTYPE html>
+# Static page boilerplate (CSS and JS) as plain strings - no f-string braces to escape
+_STATIC_HEAD = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -233,17 +279,17 @@ def generate_full_static_html(announcements):
     <link href="https://fonts.googleapis.com/css2?family=Oswald:wght@500;700&family=Special+Elite&display=swap" rel="stylesheet">
 
     <style>
-        :root {{
+        :root {
             --bg-color: #0f0f0f;
             --glass-panel: rgba(30, 28, 20, 0.7);
             --text-primary: #dcdcdc;
             --text-accent: #c5b358;
             --text-graffiti: #8c8c73;
             --border-color: #3e3b32;
-        }}
-        * {{ box-sizing: border-box; margin: 0; padding: 0; }}
-        html {{ scroll-behavior: smooth; -webkit-text-size-adjust: 100%; }}
-        body {{
+        }
+        * { box-sizing: border-box; margin: 0; padding: 0; }
+        html { scroll-behavior: smooth; -webkit-text-size-adjust: 100%; }
+        body {
             background-color: var(--bg-color);
             color: var(--text-primary);
             font-family: 'Special Elite', monospace;
@@ -252,96 +298,96 @@ def generate_full_static_html(announcements):
             display: flex; flex-direction: column; align-items: center;
             -webkit-font-smoothing: antialiased;
             touch-action: pan-x pan-y;
-        }}
-        #particle-canvas {{
+        }
+        #particle-canvas {
             position: fixed; top: 0; left: 0; width: 100%; height: 100%;
             z-index: -1;
             background: radial-gradient(circle at center, rgba(40,35,30,0.2) 0%, rgba(0,0,0,0.95) 100%);
-        }}
-        .container {{
+        }
+        .container {
             width: 90%; max-width: 1000px; margin-top: 5vh; min-height: 90vh;
             display: flex; flex-direction: column; gap: 20px; z-index: 10;
             padding-bottom: 20px;
-        }}
-        header {{ text-align: center; position: relative; margin-bottom: 20px; }}
-        h1 {{
+        }
+        header { text-align: center; position: relative; margin-bottom: 20px; }
+        h1 {
             font-family: 'Oswald', sans-serif; font-size: 4rem;
             color: var(--text-primary); text-transform: uppercase;
             letter-spacing: 5px;
             text-shadow: 0 0 20px rgba(197, 179, 88, 0.3);
-        }}
-        .graffiti-tag {{
+        }
+        .graffiti-tag {
             position: absolute; top: -10px; right: 10%;
             font-family: 'Special Elite', cursive;
             color: var(--text-graffiti); font-size: 1.2rem;
             transform: rotate(15deg); opacity: 0.8;
-        }}
-        .last-updated {{
+        }
+        .last-updated {
             font-size: 0.8rem; color: var(--text-graffiti);
             margin-top: 5px;
-        }}
-        .search-wrapper {{ position: relative; width: 100%; }}
-        #search-input {{
+        }
+        .search-wrapper { position: relative; width: 100%; }
+        #search-input {
             width: 100%; background: rgba(0, 0, 0, 0.5);
             border: 2px solid var(--text-accent); color: var(--text-accent);
             padding: 15px 20px; font-family: 'Special Elite', monospace;
             font-size: 1.2rem; outline: none; text-transform: uppercase;
-        }}
-        #search-input:focus {{
+        }
+        #search-input:focus {
             border-color: #e5d388;
             box-shadow: 0 0 10px rgba(197, 179, 88, 0.3);
-        }}
-        .results-container {{
+        }
+        .results-container {
             flex-grow: 1; overflow-y: auto;
             border-top: 1px solid var(--border-color); padding-right: 10px;
-        }}
-        .results-container::-webkit-scrollbar {{ width: 6px; }}
-        .results-container::-webkit-scrollbar-thumb {{ background: var(--text-graffiti); border-radius: 3px; }}
-        .exam-card {{
+        }
+        .results-container::-webkit-scrollbar { width: 6px; }
+        .results-container::-webkit-scrollbar-thumb { background: var(--text-graffiti); border-radius: 3px; }
+        .exam-card {
             background: var(--glass-panel); backdrop-filter: blur(5px);
             border-left: 4px solid var(--border-color);
             margin-bottom: 15px; padding: 20px;
             cursor: pointer;
             transition: transform 0.2s ease, border-color 0.2s ease, background 0.2s ease;
-        }}
-        .exam-card:hover {{
+        }
+        .exam-card:hover {
             border-left-color: var(--text-accent);
             background: rgba(50, 45, 30, 0.8);
             transform: translateX(5px);
-        }}
-        .card-header {{
+        }
+        .card-header {
             display: flex;
             justify-content: space-between;
             align-items: flex-start;
             gap: 10px;
-        }}
-        .card-date {{ font-size: 0.9rem; color: var(--text-graffiti); margin-bottom: 5px; font-weight: bold; }}
-        .card-title {{ font-size: 1.2rem; color: var(--text-primary); }}
-        .card-category {{
+        }
+        .card-date { font-size: 0.9rem; color: var(--text-graffiti); margin-bottom: 5px; font-weight: bold; }
+        .card-title { font-size: 1.2rem; color: var(--text-primary); }
+        .card-category {
             font-size: 0.75rem;
             color: var(--text-accent);
             background: rgba(197, 179, 88, 0.15);
             padding: 3px 8px;
             border-radius: 3px;
             white-space: nowrap;
-        }}
+        }
         
         /* PDF Modal */
-        #pdf-modal {{
+        #pdf-modal {
             display: none; position: fixed; top: 0; left: 0; width: 100%; height: 100%;
             background: rgba(0,0,0,0.95); z-index: 100;
             justify-content: center; align-items: center; flex-direction: column;
-        }}
-        .modal-controls {{
+        }
+        .modal-controls {
             display: flex;
             gap: 10px;
             margin-bottom: 15px;
             flex-wrap: wrap;
             justify-content: center;
-        }}
-        #pdf-frame {{ width: 85%; height: 80%; border: 1px solid var(--text-accent); background: #fff; touch-action: auto; }}
+        }
+        #pdf-frame { width: 85%; height: 80%; border: 1px solid var(--text-accent); background: #fff; touch-action: auto; }
         /* PDF Loading Indicator */
-        .pdf-loading {{
+        .pdf-loading {
             display: none;
             position: absolute;
             top: 50%;
@@ -352,9 +398,9 @@ def generate_full_static_html(announcements):
             font-size: 1.2rem;
             text-transform: uppercase;
             z-index: 101;
-        }}
-        .pdf-loading.active {{ display: block; }}
-        .pdf-loading::after {{
+        }
+        .pdf-loading.active { display: block; }
+        .pdf-loading::after {
             content: '';
             display: inline-block;
             width: 20px;
@@ -365,146 +411,121 @@ def generate_full_static_html(announcements):
             margin-left: 10px;
             animation: spin 1s linear infinite;
             vertical-align: middle;
-        }}
-        @keyframes spin {{ to {{ transform: rotate(360deg); }} }}
-        .close-btn {{
+        }
+        @keyframes spin { to { transform: rotate(360deg); } }
+        .close-btn {
             background: transparent; color: var(--text-primary);
             border: 1px solid var(--text-accent); padding: 8px 20px; cursor: pointer;
             font-family: 'Oswald', sans-serif; font-size: 1.1rem;
             transition: all 0.2s ease;
-        }}
-        .close-btn:hover {{
+        }
+        .close-btn:hover {
             background: var(--text-accent);
             color: var(--bg-color);
-        }}
-        .stats {{
+        }
+        .stats {
             text-align: center;
             font-size: 0.9rem;
             color: var(--text-graffiti);
             padding: 10px;
             background: rgba(0,0,0,0.3);
             margin-bottom: 10px;
-        }}
+        }
         
         /* Responsive - Mobile devices */
-        @media screen and (max-width: 480px) {{
-            h1 {{ font-size: 2.2rem; letter-spacing: 2px; }}
-            .graffiti-tag {{ font-size: 0.9rem; right: 5%; }}
-            .container {{ width: 95%; margin-top: 2vh; gap: 15px; }}
-            #search-input {{ padding: 12px 15px; font-size: 1rem; }}
-            .exam-card {{ padding: 15px; margin-bottom: 10px; }}
-            .card-title {{ font-size: 1rem; }}
-            .card-date {{ font-size: 0.8rem; }}
-            #pdf-frame {{ width: 95%; height: 70%; }}
-            .close-btn {{ padding: 6px 15px; font-size: 0.9rem; }}
-        }}
+        @media screen and (max-width: 480px) {
+            h1 { font-size: 2.2rem; letter-spacing: 2px; }
+            .graffiti-tag { font-size: 0.9rem; right: 5%; }
+            .container { width: 95%; margin-top: 2vh; gap: 15px; }
+            #search-input { padding: 12px 15px; font-size: 1rem; }
+            .exam-card { padding: 15px; margin-bottom: 10px; }
+            .card-title { font-size: 1rem; }
+            .card-date { font-size: 0.8rem; }
+            #pdf-frame { width: 95%; height: 70%; }
+            .close-btn { padding: 6px 15px; font-size: 0.9rem; }
+        }
 
         /* Tablets */
-        @media screen and (min-width: 481px) and (max-width: 768px) {{
-            h1 {{ font-size: 3rem; }}
-            .container {{ width: 92%; }}
-            #search-input {{ font-size: 1.1rem; }}
-            .card-title {{ font-size: 1.1rem; }}
-            #pdf-frame {{ width: 90%; }}
-        }}
+        @media screen and (min-width: 481px) and (max-width: 768px) {
+            h1 { font-size: 3rem; }
+            .container { width: 92%; }
+            #search-input { font-size: 1.1rem; }
+            .card-title { font-size: 1.1rem; }
+            #pdf-frame { width: 90%; }
+        }
 
         /* Large screens / Desktop */
-        @media screen and (min-width: 1200px) {{
-            .container {{ max-width: 1100px; }}
-            h1 {{ font-size: 4.5rem; }}
-            .card-title {{ font-size: 1.3rem; }}
-            .card-date {{ font-size: 1rem; }}
-            #search-input {{ font-size: 1.3rem; padding: 18px 25px; }}
-        }}
+        @media screen and (min-width: 1200px) {
+            .container { max-width: 1100px; }
+            h1 { font-size: 4.5rem; }
+            .card-title { font-size: 1.3rem; }
+            .card-date { font-size: 1rem; }
+            #search-input { font-size: 1.3rem; padding: 18px 25px; }
+        }
 
         /* Extra large / Wide screens */
-        @media screen and (min-width: 1600px) {{
-            .container {{ max-width: 1300px; }}
-            h1 {{ font-size: 5rem; letter-spacing: 8px; }}
-            .graffiti-tag {{ font-size: 1.5rem; }}
-            .card-title {{ font-size: 1.5rem; }}
-            .card-date {{ font-size: 1.1rem; }}
-            #search-input {{ font-size: 1.5rem; padding: 20px 30px; }}
-            .exam-card {{ padding: 25px; margin-bottom: 20px; }}
-            .close-btn {{ font-size: 1.3rem; padding: 10px 25px; }}
-        }}
+        @media screen and (min-width: 1600px) {
+            .container { max-width: 1300px; }
+            h1 { font-size: 5rem; letter-spacing: 8px; }
+            .graffiti-tag { font-size: 1.5rem; }
+            .card-title { font-size: 1.5rem; }
+            .card-date { font-size: 1.1rem; }
+            #search-input { font-size: 1.5rem; padding: 20px 30px; }
+            .exam-card { padding: 25px; margin-bottom: 20px; }
+            .close-btn { font-size: 1.3rem; padding: 10px 25px; }
+        }
 
         /* Ultra-wide screens */
-        @media screen and (min-width: 2000px) {{
-            .container {{ max-width: 1500px; }}
-            h1 {{ font-size: 6rem; }}
-            .card-title {{ font-size: 1.7rem; }}
-            .card-date {{ font-size: 1.2rem; }}
-            #search-input {{ font-size: 1.7rem; }}
-        }}
+        @media screen and (min-width: 2000px) {
+            .container { max-width: 1500px; }
+            h1 { font-size: 6rem; }
+            .card-title { font-size: 1.7rem; }
+            .card-date { font-size: 1.2rem; }
+            #search-input { font-size: 1.7rem; }
+        }
 
         /* Tall mobile screens (20:9 like modern phones) */
-        @media screen and (max-width: 480px) and (min-aspect-ratio: 9/19) {{
-            .container {{ margin-top: 3vh; }}
-            .results-container {{ max-height: 70vh; }}
-        }}
+        @media screen and (max-width: 480px) and (min-aspect-ratio: 9/19) {
+            .container { margin-top: 3vh; }
+            .results-container { max-height: 70vh; }
+        }
 
         /* Standard mobile (16:9) */
-        @media screen and (max-width: 480px) and (max-aspect-ratio: 9/16) {{
-            .results-container {{ max-height: 65vh; }}
-        }}
+        @media screen and (max-width: 480px) and (max-aspect-ratio: 9/16) {
+            .results-container { max-height: 65vh; }
+        }
 
         /* Landscape mobile */
-        @media screen and (max-height: 500px) and (orientation: landscape) {{
-            .container {{ margin-top: 2vh; }}
-            h1 {{ font-size: 2rem; }}
-            .results-container {{ max-height: 50vh; }}
-            #pdf-frame {{ height: 60%; }}
-        }}
+        @media screen and (max-height: 500px) and (orientation: landscape) {
+            .container { margin-top: 2vh; }
+            h1 { font-size: 2rem; }
+            .results-container { max-height: 50vh; }
+            #pdf-frame { height: 60%; }
+        }
 
         /* Reduced motion preference */
-        @media (prefers-reduced-motion: reduce) {{
-            *, *::before, *::after {{
+        @media (prefers-reduced-motion: reduce) {
+            *, *::before, *::after {
                 animation-duration: 0.01ms !important;
                 animation-iteration-count: 1 !important;
                 transition-duration: 0.01ms !important;
-            }}
-            #particle-canvas {{ display: none; }}
-        }}
+            }
+            #particle-canvas { display: none; }
+        }
 
         /* High contrast mode */
-        @media (prefers-contrast: high) {{
-            :root {{
+        @media (prefers-contrast: high) {
+            :root {
                 --text-primary: #ffffff;
                 --text-accent: #ffd700;
                 --border-color: #666666;
-            }}
-        }}
+            }
+        }
     </style>
 </head>
-<body>
-    <canvas id="particle-canvas"></canvas>
-
-    <div id="pdf-modal">
-        <div class="modal-controls">
-            <button class="close-btn" onclick="closePdf()">[ CLOSE FILE ]</button>
-        </div>
-        <div class="pdf-loading" id="pdf-loading">Loading PDF</div>
-        <iframe id="pdf-frame" loading="lazy"></iframe>
-    </div>
-
-    <div class="container">
-        <header>
-            <span class="graffiti-tag">live_v2</span>
-            <h1>Examination</h1>
-            <div class="last-updated">Last Updated: {last_updated}</div>
-        </header>
+'''
 
-        <div class="search-wrapper">
-            <input type="text" id="search-input" placeholder="SEARCH ANNOUNCEMENTS..." autocomplete="off" spellcheck="false">
-        </div>
-
-        <div class="stats">
-            📢 {len(announcements)} announcements loaded (max {MAX_ANNOUNCEMENTS})
-        </div>
-
-        <div class="results-container" id="results-list">
-            {cards_html}
+_STATIC_TAIL = '''
         </div>
     </div>
 
@@ -513,16 +534,16 @@ def generate_full_static_html(announcements):
         const allCards = document.querySelectorAll('.exam-card');
         
         // Search functionality
-        document.getElementById('search-input').addEventListener('input', function(e) {{
+        document.getElementById('search-input').addEventListener('input', function(e) {
             const query = e.target.value.toLowerCase();
-            allCards.forEach(card => {{
+            allCards.forEach(card => {
                 const text = card.textContent.toLowerCase();
                 card.style.display = text.includes(query) ? 'block' : 'none';
-            }});
-        }});
+            });
+        });
 
         // PDF Viewer - Uses Google Docs Viewer for cross-device compatibility
-        function openPdf(url) {{
+        function openPdf(url) {
             const pdfFrame = document.getElementById('pdf-frame');
             const pdfLoading = document.getElementById('pdf-loading');
             
@@ -535,48 +556,48 @@ def generate_full_static_html(announcements):
             pdfFrame.src = googleDocsUrl;
             
             // Hide loading when iframe loads
-            pdfFrame.onload = function() {{
+            pdfFrame.onload = function() {
                 pdfLoading.classList.remove('active');
-            }};
+            };
             
             document.getElementById('pdf-modal').style.display = 'flex';
             document.body.style.overflow = 'hidden';
-        }}
+        }
         
-        function closePdf() {{
+        function closePdf() {
             document.getElementById('pdf-modal').style.display = 'none';
             document.getElementById('pdf-frame').src = '';
             document.getElementById('pdf-loading').classList.remove('active');
             document.body.style.overflow = '';
-        }}
+        }
 
         // ESC to close
-        document.addEventListener('keydown', (e) => {{
+        document.addEventListener('keydown', (e) => {
             if(e.key === 'Escape') closePdf();
-        }});
+        });
 
         // Particles
         const canvas = document.getElementById('particle-canvas');
         const ctx = canvas.getContext('2d');
         let particles = [];
         
-        function resizeCanvas() {{
+        function resizeCanvas() {
             canvas.width = window.innerWidth;
             canvas.height = window.innerHeight;
-        }}
+        }
         resizeCanvas();
         window.addEventListener('resize', resizeCanvas);
 
-        class Particle {{
-            constructor() {{
+        class Particle {
+            constructor() {
                 this.x = Math.random() * canvas.width;
                 this.y = Math.random() * canvas.height;
                 this.size = Math.random() * 2;
                 this.speedX = (Math.random() - 0.5) * 0.5;
                 this.speedY = (Math.random() - 0.5) * 0.5;
                 this.alpha = Math.random() * 0.5;
-            }}
-            update() {{
+            }
+            update() {
                 this.x += this.speedX;
                 this.y += this.speedY;
                 this.alpha -= 0.002;
@@ -585,30 +606,103 @@ def generate_full_static_html(announcements):
                 if(this.x < 0) this.x = canvas.width;
                 if(this.y > canvas.height) this.y = 0;
                 if(this.y < 0) this.y = canvas.height;
-            }}
-        }}
+            }
+        }
 
         const isMobile = window.innerWidth < 768 || ('ontouchstart' in window);
         for(let i = 0; i < (isMobile ? 50 : 100); i++) particles.push(new Particle());
 
-        function animate() {{
+        function animate() {
             ctx.clearRect(0, 0, canvas.width, canvas.height);
             ctx.beginPath();
-            particles.forEach(p => {{
+            particles.forEach(p => {
                 p.update();
                 ctx.moveTo(p.x + p.size, p.y);
                 ctx.arc(p.x, p.y, p.size, 0, Math.PI * 2);
-            }});
+            });
             ctx.fillStyle = 'rgba(197, 179, 88, 0.3)';
             ctx.fill();
             requestAnimationFrame(animate);
-        }}
+        }
         animate();
     </script>
 </body>
 </html>'''
+
+
+def _render_card(item):
+    """Render one announcement card."""
+    category_html = f'<span class="card-category">{item.get("category", "")}</span>' if item.get("category") else ''
+    # Escape special characters in title and URL for HTML and JavaScript
+    title = item['title'].translate(_ATTR_TT)
+    url = item['url'].translate(_ATTR_TT)
+    date_text = item['date_text']
     
-    return html
+    return f'''
+            <div class="exam-card" data-url="{url}" onclick="openPdf(this.dataset.url)">
+                <div class="card-header">
+                    <div>
+                        <div class="card-date">{date_text}</div>
+                        <div class="card-title">{title}</div>
+                    </div>
+                    {category_html}
+                </div>
+            </div>
+            '''
+
+
+def generate_static_html(announcements, generated_at=None):
+    """Generate static HTML file with the announcements."""
+    return generate_full_static_html(announcements, generated_at)
+
+
+def generate_full_static_html(announcements, generated_at=None):
+    """Generate a complete static HTML page with all features from PR #2."""
+    return "".join(iter_full_static_html(announcements, generated_at))
+
+
+def iter_full_static_html(announcements, generated_at=None):
+    """Yield the complete static HTML page in fragments so it can be streamed to disk."""
+    # Last updated timestamp
+    last_updated = (generated_at or datetime.now()).strftime("%Y-%m-%d %H:%M:%S UTC")
+    
+    yield _STATIC_HEAD
+    yield f'''<body>
+    <canvas id="particle-canvas"></canvas>
+
+    <div id="pdf-modal">
+        <div class="modal-controls">
+            <button class="close-btn" onclick="closePdf()">[ CLOSE FILE ]</button>
+        </div>
+        <div class="pdf-loading" id="pdf-loading">Loading PDF</div>
+        <iframe id="pdf-frame" loading="lazy"></iframe>
+    </div>
+
+    <div class="container">
+        <header>
+            <span class="graffiti-tag">live_v2</span>
+            <h1>Examination</h1>
+            <div class="last-updated">Last Updated: {last_updated}</div>
+        </header>
+
+        <div class="search-wrapper">
+            <input type="text" id="search-input" placeholder="SEARCH ANNOUNCEMENTS..." autocomplete="off" spellcheck="false">
+        </div>
+
+        <div class="stats">
+            📢 {len(announcements)} announcements loaded (max {MAX_ANNOUNCEMENTS})
+        </div>
+
+        <div class="results-container" id="results-list">
+            '''
+
+    # Generate announcement cards
+    if announcements:
+        yield from map(_render_card, announcements)
+    else:
+        yield '<div style="text-align:center; color: #666; margin-top: 20px;">[ NO RECORDS FOUND - CHECK BACK LATER ]</div>'
+
+    yield _STATIC_TAIL
 
 
 def main():
@@ -620,31 +714,69 @@ def main():
     # Create output directory
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     
-    # Fetch announcements
-    announcements = fetch_announcements()
-    
-    # Generate static HTML
-    html_content = generate_static_html(announcements)
+    # Fetch announcements (conditional GET against the last build, unless FORCE=1)
+    http_cache = {} if os.environ.get("FORCE") else load_http_cache()
+    announcements = fetch_announcements(http_cache)
+    if announcements is None:
+        print(f"--- [INFO] Source unchanged, keeping existing {OUTPUT_DIR} ---")
+        return
+    now = datetime.now()
     
-    # Write to file
+    # Generate static HTML, streaming fragments straight to the file
     output_path = os.path.join(OUTPUT_DIR, "index.html")
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    with open(output_path, "w", encoding="utf-8", buffering=1 << 16) as f:
+        f.writelines(iter_full_static_html(announcements, now))
     
     print(f"--- [SUCCESS] Generated {output_path} ---")
     print(f"--- [INFO] Total announcements: {len(announcements)} ---")
     
     # Also save data as JSON for reference
     json_path = os.path.join(OUTPUT_DIR, "data.json")
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump({
-            "generated_at": datetime.now().isoformat(),
-            "count": len(announcements),
-            "announcements": announcements
-        }, f, indent=2)
+    data = {
+        "generated_at": now.isoformat(),
+        "count": len(announcements),
+        "announcements": announcements
+    }
+    if ORJSON_AVAILABLE:
+        # orjson returns UTF-8 bytes, so write them directly
+        with open(json_path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
     
     print(f"--- [SUCCESS] Generated {json_path} ---")
 
+    # Only remember the validators once the site they describe is on disk;
+    # after an empty (failed) build, forget them so the next run cannot get a 304
+    if announcements:
+        save_http_cache(http_cache)
+    elif os.path.exists(HTTP_CACHE_PATH):
+        os.remove(HTTP_CACHE_PATH)
+
+
+def run_profiled():
+    """Run main() under cProfile and tracemalloc and print where time and memory go."""
+    tracemalloc.start()
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        main()
+    finally:
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        print("--- [PROFILE] TOP 30 BY CUMULATIVE TIME ---")
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(30)
+        print("--- [PROFILE] TOP 20 ALLOCATION SITES ---")
+        for stat in snapshot.statistics("lineno")[:20]:
+            print(stat)
+
 
 if __name__ == "__main__":
-    main()
+    # PROFILE=1 python generate_static.py   (profile a run)
+    # FORCE=1 python generate_static.py     (rebuild even if the page is unchanged)
+    if os.environ.get("PROFILE"):
+        run_profiled()
+    else:
+        main()
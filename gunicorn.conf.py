@@ -0,0 +1,11 @@
+# gunicorn.conf.py
+# Loaded automatically when gunicorn is started from the project directory.
+
+
+def post_worker_init(worker):
+    """Set up the database and background sync in exactly one worker."""
+    import app
+    # Only the lock holder schedules the sync; if it dies, its replacement takes the lock over
+    if app.acquire_scheduler_lock():
+        app.init_db()
+        app.start_scheduler()